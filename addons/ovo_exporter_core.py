@@ -32,6 +32,16 @@ except ImportError:
     from ovo_exporter_mesh import OVOMeshManager
     from ovo_log import log
 
+# --------------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------------
+# Blender (Z-up) to OpenGL (Y-up) change of basis, built once at import time
+_C = mathutils.Matrix(((1, 0, 0, 0),
+                       (0, 0, 1, 0),
+                       (0, -1, 0, 0),
+                       (0, 0, 0, 1)))
+_C_INV = _C.transposed()
+
 # --------------------------------------------------------
 # OVO EXPORTER CLASS
 # --------------------------------------------------------
@@ -58,14 +68,8 @@ class OVO_Exporter:
 
     def convert_openGl(self, matrix):
 
-        matrix_copy = matrix.copy()
-        C = mathutils.Matrix(((1,0,0,0),
-                      (0,0,1,0),
-                      (0,-1,0,0),
-                      (0,0,0,1)))
-        C_inv = C.transposed() 
-
-        return C @ matrix_copy @ C_inv
+        # The products return a new matrix, so the input needs no defensive copy
+        return _C @ matrix @ _C_INV
 
     def should_export_object(self, obj):
         """
@@ -23,6 +23,21 @@ except ImportError:
     from ovo_packer import OVOPacker
     from ovo_log import log
 
+# --------------------------------------------------------
+# Scratch BMesh
+# --------------------------------------------------------
+# A single BMesh reused by safe_calc_tangents across calls.
+# It is cleared before each use and freed on unregister.
+_scratch_bm = None
+
+
+def free_scratch_bmesh():
+    """Free the shared scratch BMesh used by safe_calc_tangents."""
+    global _scratch_bm
+    if _scratch_bm is not None:
+        _scratch_bm.free()
+        _scratch_bm = None
+
 # --------------------------------------------------------
 # OVOMeshManager
 # --------------------------------------------------------
@@ -50,15 +65,20 @@ class OVOMeshManager:
             Returns (loop_tangent, loop_sign) even if the mesh contains n-gons.
             Loop numbering remains identical to src_mesh.loops.
             """
-            import bmesh
+            global _scratch_bm
             # memory copy - doesn't touch the original mesh
             mesh_copy = src_mesh.copy()
 
-            bm_calc = bmesh.new()
+            # reuse the module-level BMesh instead of allocating a new one
+            if _scratch_bm is None:
+                _scratch_bm = bmesh.new()
+            else:
+                _scratch_bm.clear()
+            bm_calc = _scratch_bm
             bm_calc.from_mesh(mesh_copy)
             bmesh.ops.triangulate(bm_calc, faces=bm_calc.faces)
             bm_calc.to_mesh(mesh_copy)
-            bm_calc.free()
+            bm_calc.clear()
 
             mesh_copy.calc_tangents()                # now it won't throw exceptions
             loop_tan  = [l.tangent.copy()   for l in mesh_copy.loops]
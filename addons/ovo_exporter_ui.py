@@ -16,9 +16,11 @@ from bpy.types import Operator, Panel
 
 try:
     from .ovo_exporter_core import OVO_Exporter
+    from .ovo_exporter_mesh import free_scratch_bmesh
     from .ovo_log import log
 except ImportError:
     from ovo_exporter_core import OVO_Exporter
+    from ovo_exporter_mesh import free_scratch_bmesh
     from ovo_log import log
 
 # --------------------------------------------------------
@@ -128,6 +130,7 @@ def register():
 
 def unregister():
     """Unregister the exporter operator and remove menu entry."""
+    free_scratch_bmesh()
     try:
         bpy.utils.unregister_class(OT_ExportOVO)
         bpy.types.TOPBAR_MT_file_export.remove(menu_func_export)
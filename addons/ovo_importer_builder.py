@@ -8,8 +8,8 @@
 #   - LightFactory for LIGHT nodes,
 #   - NodeFactory for generic nodes.
 #
-# It then builds the parent–child hierarchy, creates a root if needed,
-# and applies final transformations.
+# Objects, their parent–child hierarchy and final transformations are
+# set up in a single pass; a root is created afterwards if needed.
 # ================================================================
 
 # --------------------------------------------------------
@@ -19,19 +19,32 @@ import math
 
 import bpy
 import mathutils
+import numpy as np
 
 try:
-    from .ovo_types import LightType
+    from .ovo_types import ChunkType, LightType
     from .ovo_mesh_factory import MeshFactory
     from .ovo_light_factory import LightFactory
     from .ovo_node_factory import NodeFactory
-    from .ovo_log import log
+    from .ovo_log import log, log_enabled
 except ImportError:
-    from ovo_types import LightType
+    from ovo_types import ChunkType, LightType
     from ovo_mesh_factory import MeshFactory
     from ovo_light_factory import LightFactory
     from ovo_node_factory import NodeFactory
-    from ovo_log import log
+    from ovo_log import log, log_enabled
+
+# Separator line used in the build banners
+_SEPARATOR = "=" * 60
+
+# Conversion matrix from OpenGL (Y-up) to Blender (Z-up) and its inverse
+_C = np.array((
+    (1, 0, 0, 0),
+    (0, 0, 1, 0),
+    (0, -1, 0, 0),
+    (0, 0, 0, 1)
+), dtype=np.float64)
+_C_INV = _C.T
 
 # --------------------------------------------------------
 # OVO SCENE BUILDER CLASS
@@ -45,10 +58,12 @@ class OVOSceneBuilder:
         materials (dict): Dictionary mapping material names to OVOMaterial objects.
         texture_directory (str): Base folder to search for texture files.
         flip_textures (bool): Whether to flip textures vertically.
-        record_to_object (dict): Maps each NodeRecord to its created Blender object.
+        matrices (numpy.ndarray): Optional (N, 4, 4) block with the raw matrix of each NodeRecord.
+        record_to_object (list): Blender object created for each NodeRecord, indexed by its position in node_records.
+        top_indices (list): Indices of the top-level records, collected while building the hierarchy.
     """
 
-    def __init__(self, node_records, materials, texture_directory, flip_textures=True):
+    def __init__(self, node_records, materials, texture_directory, flip_textures=True, matrices=None):
         """
         Initialize with parsed data.
 
@@ -56,12 +71,16 @@ class OVOSceneBuilder:
         :param materials: A dictionary of material data keyed by material name.
         :param texture_directory: The directory where texture files are located.
         :param flip_textures: Whether to flip textures vertically.
+        :param matrices: Optional (N, 4, 4) array with the raw matrices of node_records
+                         (as kept by the parser); stacked from the records when omitted.
         """
         self.node_records = node_records
         self.materials = materials
         self.texture_directory = texture_directory
         self.flip_textures = flip_textures
-        self.record_to_object = {}
+        self.matrices = matrices
+        self.record_to_object = [None] * len(node_records)
+        self.top_indices = []
 
     # --------------------------------------------------------
     # Build Scene
@@ -71,124 +90,192 @@ class OVOSceneBuilder:
         Main entry point to build the Blender scene.
 
         Steps:
-          1) For each NodeRecord, create an object using the appropriate factory.
-          2) Build parent–child relationships using a stack-based approach.
-          3) Establish a [root] node if multiple top-level nodes exist.
-          4) Apply final transformations (transpose, rotations, quaternion corrections).
+          1) Compute the final Blender matrices of all nodes in one batch.
+          2) In a single pass over the NodeRecords, create each object with the
+             appropriate factory, attach it to its parent (stack-based) and
+             assign its matrix_basis.
+          3) Link all objects to the active collection at once.
+          4) Establish a [root] node if multiple top-level nodes exist.
+          5) Apply physics.
+          6) Evaluate the view layer once, now that all data is in place.
+
+        Nothing in steps 1-5 forces a depsgraph evaluation, so the many
+        property changes above are evaluated together at the end.
         """
-        log("", category="")
-        log("============================================================", category="")
-        log("[OVOSceneBuilder] Starting scene build from parsed nodes", category="")
-        log("============================================================", category="")
-
-        # Create a Blender object for each node record using factories.
-        for rec in self.node_records:
-            if rec.node_type == "MESH":
-                obj = MeshFactory.create(rec, self.materials, self.texture_directory, flip_textures=self.flip_textures)
-            elif rec.node_type == "LIGHT":
-                obj = LightFactory.create(rec)
-            else:
-                # Use NodeFactory for generic nodes.
-                obj = NodeFactory.create(rec)
-            self.record_to_object[rec] = obj
+        # Banners are written with a single log call each
+        log(f"\n{_SEPARATOR}\n[OVOSceneBuilder] Starting scene build from parsed nodes\n{_SEPARATOR}", category="")
+
+        # Create objects, hierarchy and transformations in one traversal.
+        self._create_objects()
 
-        # Build the hierarchy (parent–child relationships).
-        self._build_hierarchy()
+        # Link all created objects to the active collection in a single pass.
+        self._link_objects()
 
         # Establish a root node if more than one top-level node exists.
         self._establish_root_node()
 
-        # Apply final transformations for proper orientation.
-        self._apply_transformations()
+        # Rigid body setup needs objects that are already in the scene.
+        physics = [(obj, rec.physics_data)
+                   for rec, obj in zip(self.node_records, self.record_to_object)
+                   if rec.physics_data]
+        if physics:
+            MeshFactory.add_rigid_bodies([obj for obj, _ in physics])
+            for obj, phys in physics:
+                MeshFactory.apply_physics(obj, phys)
+
+        # Single depsgraph evaluation for everything tagged during the build.
+        bpy.context.view_layer.update()
 
-        log("", category="")
-        log("[OVOSceneBuilder] Scene build complete", category="")
         flip_status = "flipped" if self.flip_textures else "not flipped"
-        log(f"Textures were {flip_status} during import", category="")
-        log("============================================================", category="")
+        log(f"\n[OVOSceneBuilder] Scene build complete\nTextures were {flip_status} during import\n{_SEPARATOR}",
+            category="")
+
+    # --------------------------------------------------
+    #  Create Objects
+    # --------------------------------------------------
+    def _create_objects(self):
+        """
+        Creates the Blender objects, their hierarchy and transformations in a
+        single pass over the NodeRecord objects.
+
+        For each record, in file order (so Blender's name suffixes follow it):
+          - Creates the object with the factory matching its node_type
+            (NodeFactory for generic nodes).
+          - Assigns its parent from the precomputed parent indices
+            (see _compute_parent_indices).
+          - Assigns the precomputed matrix_basis (except for a [root] node).
+        """
+        log("[OVOSceneBuilder] Creating objects and applying transformations...", category="")
+
+        factories = {
+            ChunkType.MESH: lambda r: MeshFactory.create(r, self.materials, self.texture_directory, flip_textures=self.flip_textures),
+            ChunkType.LIGHT: LightFactory.create,
+        }
+        default_factory = NodeFactory.create
+
+        records = self.node_records
+        r2o = self.record_to_object
+        matrices = self._compute_matrices()
+        parent_idx = self._compute_parent_indices([rec.children_count for rec in records])
+        top_indices = []
+        for i, (rec, p) in enumerate(zip(records, parent_idx)):
+            obj = factories.get(rec.node_type, default_factory)(rec)
+            r2o[i] = obj
+
+            # Hierarchy
+            # A [root] node can only be top-level, so the name is checked there only
+            is_root = False
+            if p >= 0:
+                obj.parent = r2o[p]
+            else:
+                top_indices.append(i)
+                is_root = rec.name == "[root]"
+
+            # Transformation
+            if is_root:
+                if log_enabled("NODE"):
+                    log("Skipping [root] node.", category="NODE", indent=1)
+                continue
+            obj.matrix_basis = mathutils.Matrix(matrices[i])
+
+        self.top_indices = top_indices
 
     # --------------------------------------------------
-    #  Build Hierarchy
+    #  Compute Parent Indices
     # --------------------------------------------------
-    def _build_hierarchy(self):
+    @staticmethod
+    def _compute_parent_indices(children_counts):
         """
-        Creates parent-child relationships among the NodeRecord objects.
+        Computes the parent index of every record from the depth-first
+        children counts stored in the file.
+
+        Uses a stack of record indices: each record with children is pushed,
+        and its remaining count (kept in a local copy, so NodeRecords are not
+        mutated) is decreased as children are assigned.
 
-        Uses a stack-based approach:
-          - Iterates over all NodeRecord objects.
-          - Assigns a parent for each child based on the 'children_count'.
-          - Decreases the parent's children_count as children are assigned.
+        :param children_counts: List with the children_count of each record.
+        :return: List with the parent index of each record (-1 for top-level).
         """
+        remaining = list(children_counts)
+        parent_idx = [-1] * len(remaining)
         stack = []
-        for rec in self.node_records:
-            while stack and stack[-1].children_count == 0:
+        for i, count in enumerate(remaining):
+            while stack and remaining[stack[-1]] == 0:
                 stack.pop()
 
             if stack:
-                parent_rec = stack[-1]
-                rec_obj = self.record_to_object[rec]
-                par_obj = self.record_to_object[parent_rec]
-                rec_obj.parent = par_obj
-                parent_rec.children_count -= 1
+                p = stack[-1]
+                parent_idx[i] = p
+                remaining[p] -= 1
+
+            if count > 0:
+                stack.append(i)
 
-            if rec.children_count > 0:
-                stack.append(rec)
+        return parent_idx
 
     # --------------------------------------------------
-    #  Establish Root Node
+    #  Compute Matrices
     # --------------------------------------------------
-    def _establish_root_node(self):
+    def _compute_matrices(self):
         """
-        Checks if multiple top-level nodes exist. If so, creates a fake "[root]"
-        empty object and parents all top-level objects to it.
+        Computes the final Blender matrix of every NodeRecord.
+
+        All raw matrices are processed in one batched einsum over a single
+        (N, 4, 4) array, either the parser's matrices block or, if none was
+        given, one stacked from the records:
+          - Transposes each raw_matrix (row-major) to obtain Blender's column-major matrix.
+          - Applies the change of base for every object from Y-up to Z-up (C_inv @ M @ C).
+
+        :return: A list with one 4x4 nested list per record.
         """
-        top_records = [rec for rec in self.node_records if not self.record_to_object[rec].parent]
-        if len(top_records) > 1:
-            log("[OVOSceneBuilder] Multiple top-level nodes detected; creating [root].", category="NODE")
-            root_obj = bpy.data.objects.new("[root]", None)
-            root_obj.empty_display_type = 'PLAIN_AXES'
-            bpy.context.collection.objects.link(root_obj)
+        records = self.node_records
+        if not records:
+            return []
+
+        # 1) row→col-major and 2) similarity transform OpenGL→Blender, for all nodes at once
+        # The float32 file matrices are upcast so the products run in double precision
+        if self.matrices is not None:
+            raws = self.matrices.astype(np.float64)
+        else:
+            raws = np.array([rec.raw_matrix for rec in records], dtype=np.float64)
+        transformed = np.einsum('ij,njk,kl->nil', _C_INV, raws.transpose(0, 2, 1), _C)
 
-            for rec in top_records:
-                self.record_to_object[rec].parent = root_obj
+        # bpy data is not thread-safe, so assignments stay serial; converting the
+        # whole batch to nested lists at once keeps the per-node work minimal
+        return transformed.tolist()
 
     # --------------------------------------------------
-    #  Apply Final Transformations
+    #  Link Objects
     # --------------------------------------------------
-    def _apply_transformations(self):
-        """
-        Finalizes the scene by applying the correct object transformations.
-        For each NodeRecord:
-          - Converts the raw_matrix (list of 4-tuples, row-major) to a mathutils.Matrix.
-          - Transposes it to obtain Blender's column-major matrix.
-          - Applies the change of base for every object from Y-up to Z-up.
+    def _link_objects(self):
         """
-        log("[OVOSceneBuilder] Applying transformations...", category="")
-
-        # Conversion matrix from OpenGL to Blender
-        C = mathutils.Matrix((
-            (1, 0, 0, 0),
-            (0, 0, 1, 0),
-            (0, -1, 0, 0),
-            (0, 0, 0, 1)
-        ))
-        C_inv = C.transposed()
-
-        for rec in self.node_records:
-            if rec.name == "[root]":
-                log("Skipping [root] node.", category="NODE", indent=1)
-                continue
+        Links every created object to the active collection.
 
-            obj = self.record_to_object.get(rec)
-            if not obj:
-                log(f"Node '{rec.name}' has no associated Blender object. Skipping.", category="NODE", indent=1)
-                continue
+        Factories return unlinked objects so that linking happens in one
+        batch after all objects exist.
+        """
+        link = bpy.context.collection.objects.link
+        for obj in self.record_to_object:
+            link(obj)
 
-            # 1) row→col-major
-            mat = mathutils.Matrix(rec.raw_matrix).transposed()
+    # --------------------------------------------------
+    #  Establish Root Node
+    # --------------------------------------------------
+    def _establish_root_node(self):
+        """
+        Checks if multiple top-level nodes exist. If so, creates a fake "[root]"
+        empty object and parents all top-level objects to it.
 
-            # 2) similarity transform OpenGL→Blender
-            transformed_mat = C_inv @ mat @ C
+        Top-level records are collected by _create_objects, so no second
+        scan over the records or their Blender objects is needed.
+        """
+        top = self.top_indices
+        if len(top) > 1:
+            log("[OVOSceneBuilder] Multiple top-level nodes detected; creating [root].", category="NODE")
+            root_obj = bpy.data.objects.new("[root]", None)
+            root_obj.empty_display_type = 'PLAIN_AXES'
+            bpy.context.collection.objects.link(root_obj)
 
-            # 3) Apply the matrix_basis
-            obj.matrix_basis = transformed_mat
\ No newline at end of file
+            r2o = self.record_to_object
+            for i in top:
+                r2o[i].parent = root_obj
@@ -6,9 +6,9 @@
 #   - A header of 8 bytes (4 bytes for chunk_id, 4 bytes for chunk_size)
 #   - The actual binary data of length chunk_size.
 #
-# The static method read_chunk() reads these values from a binary file
-# (or file-like object) and returns an OVOChunk instance, or None if
-# the end of the file is reached.
+# The static method read_chunk_from() reads these values from a buffer
+# holding the whole file and returns an OVOChunk instance together with
+# the offset of the next chunk, or None if the end of the buffer is reached.
 # ================================================================
 
 # --------------------------------------------------------
@@ -16,6 +16,9 @@
 # --------------------------------------------------------
 import struct
 
+# Chunk header: chunk_id and chunk_size as little-endian unsigned ints
+_HEADER = struct.Struct("<II")
+
 # --------------------------------------------------------
 # Chunk Representation
 # --------------------------------------------------------
@@ -23,38 +26,45 @@ class OVOChunk:
     """
     Represents a single chunk of data read from the .ovo file.
 
+    The chunk does not own a copy of its data: it references the buffer holding
+    the whole file and the offset where its data starts, so parsers can unpack
+    fields in place.
+
     Attributes:
         chunk_id (int): The ID indicating the type of data in this chunk.
         chunk_size (int): The number of bytes in the data portion.
-        data (bytes): The raw binary data of the chunk.
+        buffer: The buffer holding the whole file.
+        offset (int): Offset of the chunk data within buffer.
     """
 
-    def __init__(self, chunk_id, chunk_size, data):
+    def __init__(self, chunk_id, chunk_size, buffer, offset):
         self.chunk_id = chunk_id
         self.chunk_size = chunk_size
-        self.data = data
+        self.buffer = buffer
+        self.offset = offset
 
     # --------------------------------------------------------
     # Read Chunk
     # --------------------------------------------------------
     @staticmethod
-    def read_chunk(file_obj):
+    def read_chunk_from(buffer, offset):
         """
-        Reads one chunk from the given binary file.
+        Reads one chunk from an in-memory buffer holding the whole file.
 
         The chunk header consists of 8 bytes:
           - 4 bytes: Unsigned integer for chunk_id (little-endian)
           - 4 bytes: Unsigned integer for chunk_size (little-endian)
 
-        After the header, the function reads chunk_size bytes for the chunk data.
+        The header is unpacked in place and the chunk only records where its
+        data starts, so no bytes are copied.
 
-        :param file_obj: A binary file-like object open for reading.
-        :return: An OVOChunk instance if successful, or None when end-of-file is reached.
+        :param buffer: A bytes-like object holding the file contents.
+        :param offset: Offset of the chunk header within the buffer.
+        :return: A tuple (OVOChunk, next_offset), or (None, offset) when the end of the buffer is reached.
         """
-        header = file_obj.read(8)
-        if len(header) < 8:
-            return None
+        data_start = offset + _HEADER.size
+        if data_start > len(buffer):
+            return None, offset
         # Unpack the header: two unsigned integers (chunk_id and chunk_size)
-        cid, csize = struct.unpack("<II", header)
-        cdata = file_obj.read(csize)
-        return OVOChunk(cid, csize, cdata)
\ No newline at end of file
+        cid, csize = _HEADER.unpack_from(buffer, offset)
+        return OVOChunk(cid, csize, buffer, data_start), data_start + csize
@@ -23,6 +23,9 @@ except ImportError:
     from ovo_importer_builder import OVOSceneBuilder
     from ovo_log import log
 
+# Separator line used in the import banners
+_SEPARATOR = "=" * 60
+
 # --------------------------------------------------------
 # OVO Importer Class
 # --------------------------------------------------------
@@ -63,9 +66,8 @@ class OVOImporter:
 
         :return: A dictionary with the status, either {'FINISHED'} or {'CANCELLED'}.
         """
-        log("", category="")
-        log("============================================================", category="")
-        log(f"[OVOImporter] Starting import of {self.filepath}", category="")
+        # Banner written with a single log call
+        log(f"\n{_SEPARATOR}\n[OVOImporter] Starting import of {self.filepath}", category="")
 
         # Step 1: Parse the file.
         parser = OVOImporterParser(self.filepath)
@@ -79,11 +81,12 @@ class OVOImporter:
             node_records=parser.node_records,
             materials=parser.materials,
             texture_directory=texture_dir,
-            flip_textures=self.flip_textures
+            flip_textures=self.flip_textures,
+            matrices=parser.matrices
         )
 
         builder.build_scene()
 
         log("[OVOImporter] Import completed successfully.", category="NODE")
-        log("============================================================\n", category="")
+        log(f"{_SEPARATOR}\n", category="")
         return {'FINISHED'}
\ No newline at end of file
@@ -30,8 +30,14 @@ class OVOMaterial:
         transparency (float): Transparency (alpha) value.
         emissive (tuple): A 3-tuple (ex, ey, ez) representing emissive color.
         textures (dict): Dictionary containing texture file names keyed by type (e.g., "albedo", "normal", etc.).
+        blender_material: The Blender material built from this data, shared by every mesh using it.
     """
 
+    __slots__ = (
+        "name", "base_color", "roughness", "metallic", "transparency",
+        "emissive", "textures", "blender_material",
+    )
+
     def __init__(self, name, base_color, roughness, metallic, transparency, emissive, textures):
         self.name = name
         self.base_color = base_color
@@ -60,6 +66,11 @@ class OVOPhysicsData:
         ang_damp (float): Angular damping coefficient.
     """
 
+    __slots__ = (
+        "obj_type", "hull_type", "mass", "static_fric", "dyn_fric",
+        "bounciness", "lin_damp", "ang_damp",
+    )
+
     def __init__(self, obj_type, hull_type, mass, static_fric, dyn_fric, bounciness, lin_damp, ang_damp):
         self.obj_type = obj_type
         self.hull_type = hull_type
@@ -78,23 +89,24 @@ class NodeRecord:
     Unified container for node data extracted from the .ovo file.
 
     This class is used to represent:
-      - Generic nodes (node_type="NODE")
-      - Meshes (node_type="MESH")
-      - Lights (node_type="LIGHT")
+      - Generic nodes (node_type=ChunkType.NODE)
+      - Meshes (node_type=ChunkType.MESH)
+      - Lights (node_type=ChunkType.LIGHT)
 
     Attributes:
         name (str): Name of the node.
-        node_type (str): "NODE", "MESH", or "LIGHT".
+        node_type (int): The ChunkType code of the chunk the node was read from
+            (ChunkType.NODE, ChunkType.MESH or ChunkType.LIGHT).
         children_count (int): The number of children nodes expected.
-        raw_matrix (list): A 4x4 list (row-major) representing the node's transform.
+        raw_matrix (numpy.ndarray): A (4, 4) float32 array (row-major) representing the node's transform.
         blender_object: A placeholder for the Blender object created later.
         parent: Reference to the parent NodeRecord (if any).
 
     Additional attributes for MESH:
         material_name (str): Name of the material to apply.
-        vertices (list): List of vertex positions (tuples).
-        faces (list): List of faces (each a tuple of vertex indices).
-        uvs (list): List of UV coordinates (tuples).
+        vertices (numpy.ndarray): (N, 3) float32 array of vertex positions.
+        faces (numpy.ndarray): (F, 3) int32 array of triangle vertex indices.
+        uvs (numpy.ndarray): (N, 2) float32 array of UV coordinates.
         physics_data (OVOPhysicsData): Container for physics-related data.
         lod_count (int): The number of Levels Of Detail.
 
@@ -109,6 +121,17 @@ class NodeRecord:
         volumetric (int): Volumetric flag.
     """
 
+    # Slots keep records compact and make attribute access a slot load,
+    # which matters in the builder loops that touch every record.
+    __slots__ = (
+        "name", "node_type", "children_count", "raw_matrix",
+        "blender_object", "parent",
+        "material_name", "vertices", "faces", "uvs", "physics_data", "lod_count",
+        "light_type", "color", "radius", "direction", "cutoff", "spot_exponent",
+        "shadow", "volumetric", "light_quat",
+        "bounding_radius", "min_box", "max_box",
+    )
+
     def __init__(self, name, node_type, children_count, raw_matrix):
         self.name = name
         self.node_type = node_type
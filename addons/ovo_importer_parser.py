@@ -7,31 +7,81 @@
 #      the raw binary data into Python objects (NodeRecord and OVOMaterial).
 #   3) Stores the parsed materials in a dictionary and nodes in a list.
 #
-# All low-level utilities (e.g. half-float decoding and null-terminated string reading)
-# are imported from the utility module.
+# All chunks are parsed in place from a read-only memory map of the whole
+# file, using offsets instead of stream objects. Low-level utilities (e.g.
+# null-terminated string reading) are imported from the utility module.
 # ================================================================
 
 # --------------------------------------------------------
 # IMPORTS
 # --------------------------------------------------------
 import math
+import mmap
 import os
-import io
 import struct
 import mathutils
+import numpy as np
 
 try:
-    from .ovo_importer_utils import half_to_float, decode_half2x16, read_null_terminated_string
+    from .ovo_importer_utils import read_cstr, read_cstr_bytes
     from .ovo_importer_chunk import OVOChunk
     from .ovo_importer_node import OVOMaterial, NodeRecord, OVOPhysicsData
     from .ovo_types import ChunkType, LightType
-    from .ovo_log import log
+    from .ovo_log import log, log_enabled
 except ImportError:
-    from ovo_importer_utils import half_to_float, decode_half2x16, read_null_terminated_string
+    from ovo_importer_utils import read_cstr, read_cstr_bytes
     from ovo_importer_chunk import OVOChunk
     from ovo_importer_node import OVOMaterial, NodeRecord, OVOPhysicsData
     from ovo_types import ChunkType
-    from ovo_log import log
+    from ovo_log import log, log_enabled
+
+# --------------------------------------------------------
+# Binary Layouts
+# --------------------------------------------------------
+# Precompiled structs for the fixed-size parts of each chunk, so adjacent
+# fields are unpacked with a single call and no format string is re-parsed.
+
+# Node transform: 16 little-endian floats, row-major
+_MATRIX_SIZE = 64
+# Material: emissive (3f), base color (3f), roughness, metallic, transparency
+_MATERIAL_VALUES = struct.Struct("<3f3ffff")
+# Light: type, color (3f), radius, direction (3f), cutoff, spot exponent, shadow, volumetric
+_LIGHT_VALUES = struct.Struct("<B3ff3fffBB")
+# Mesh: bounding radius, min box and max box (kept as raw bytes), physics flag
+_MESH_BOUNDS = struct.Struct("<f12s12sB")
+# Physics: object type, contCollision, collide_with_rb, hull type, mass center (skipped),
+# mass, frictions, bounciness, dampings, number of hulls, padding and two reserved pointers (skipped)
+_PHYSICS_VALUES = struct.Struct("<4B12x6fI4x16x")
+# Hull header: number of vertices, number of faces, centroid (skipped)
+_HULL_HEADER = struct.Struct("<2I12x")
+_UINT = struct.Struct("<I")
+_UINT2 = struct.Struct("<2I")
+
+# Layout of one mesh vertex: position (3 floats), packed normal,
+# UV (two half floats) and packed tangent, 24 bytes in total
+_VERTEX_DTYPE = np.dtype([
+    ("pos", "<f4", 3),
+    ("normal", "<u4"),
+    ("uv", "<f2", 2),
+    ("tangent", "<u4"),
+])
+
+
+def _check_size(off: int, size: int, end: int):
+    """Raises struct.error if reading size bytes at off would run past the chunk end."""
+    if off + size > end:
+        raise struct.error(f"chunk data ends at offset {end}, cannot read {size} bytes at offset {off}")
+
+
+def _unpack(layout: struct.Struct, buf, off: int, end: int):
+    """Unpacks a precompiled struct at off, refusing to read past the chunk end."""
+    _check_size(off, layout.size, end)
+    return layout.unpack_from(buf, off)
+
+
+def _texture_name(raw):
+    """Decodes a raw texture name, or returns None for the b"[none]" placeholder."""
+    return None if raw == b"[none]" else raw.decode("utf-8", errors="replace")
 
 
 # --------------------------------------------------------
@@ -50,6 +100,8 @@ class OVOImporterParser:
       - All parsed data is stored in:
           - self.materials: a dictionary of {materialName: OVOMaterial}
           - self.node_records: a list of NodeRecord objects
+          - self.matrices: a (N, 4, 4) float32 array with the raw matrix of each
+            NodeRecord, in the same order (each raw_matrix is a view into it)
     """
 
     def __init__(self, filepath: str):
@@ -59,9 +111,18 @@ class OVOImporterParser:
         :param filepath: Full path to the .ovo file to import.
         """
         self.filepath = filepath
-        self.chunks = []
         self.materials = {}
         self.node_records = []
+        self.matrices = np.empty((0, 4, 4), dtype=np.float32)
+        # Next free slot in node_records and matrices (both presized in parse_file)
+        self._node_index = 0
+
+        # Chunk ID -> parse method for the chunks that become NodeRecords
+        self._node_parsers = {
+            ChunkType.NODE: self._parse_node,
+            ChunkType.LIGHT: self._parse_light,
+            ChunkType.MESH: self._parse_mesh,
+        }
 
     # --------------------------------------------------------
     # Parse File
@@ -72,8 +133,17 @@ class OVOImporterParser:
 
         Steps:
           1. Check if the file exists. If not, log an error and return False.
-          2. Open the file in binary mode and repeatedly call OVOChunk.read_chunk().
-          3. For each chunk read, call _parse_chunk() to interpret its contents.
+          2. Map the file read-only into memory and repeatedly call
+             OVOChunk.read_chunk_from() on the mapping, so chunk data is
+             unpacked straight from the page cache without copying the file.
+             An empty file is handled as an empty buffer (it cannot be mapped).
+          3. Count the NODE, LIGHT and MESH chunks from their headers and presize
+             node_records and matrices accordingly.
+          4. Pass each chunk straight to _parse_chunk() to interpret its contents,
+             without keeping a list of chunks around.
+
+        A truncated or malformed file is logged as an error and reported as a
+        failed parse, instead of propagating the exception out of the mapping.
 
         :return: True if the file was successfully read and parsed; otherwise, False.
         """
@@ -81,19 +151,71 @@ class OVOImporterParser:
             log(f"[OVOImporterParser] ERROR: File not found: {self.filepath}", category="ERROR")
             return False
 
-        # Open file and read all chunks.
         with open(self.filepath, "rb") as f:
-            while True:
-                chunk = OVOChunk.read_chunk(f)
-                if chunk is None:
-                    break
-                self.chunks.append(chunk)
-
-        # Parse each chunk into proper data structures.
-        for chunk in self.chunks:
+            if os.fstat(f.fileno()).st_size == 0:
+                self._parse_buffer(b"")
+                return True
+            # Chunks are addressed by offset into the mapping. Every parsed array
+            # is a copy, so the mapping can be closed once parsing is done.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                # The error is caught inside the mapping and only its message is
+                # kept: the exception's frames still hold numpy views into the
+                # mapping, and they must be released before it can be closed.
+                try:
+                    self._parse_buffer(buffer)
+                    error = None
+                except (struct.error, ValueError) as e:
+                    error = str(e)
+
+        if error is not None:
+            log(f"[OVOImporterParser] ERROR: Malformed file {self.filepath}: {error}", category="ERROR")
+            return False
+        return True
+
+    # --------------------------------------------------------
+    # Parse Buffer
+    # --------------------------------------------------------
+    def _parse_buffer(self, buffer):
+        """
+        Parses every chunk of a buffer holding the whole file.
+
+        :param buffer: The file contents (an mmap or bytes-like object).
+        """
+        # Size node_records and matrices up front from a pass over the chunk headers only.
+        node_count = self._count_node_chunks(buffer)
+        self.node_records = [None] * node_count
+        self.matrices = np.empty((node_count, 4, 4), dtype=np.float32)
+        self._node_index = 0
+
+        # Parse each chunk into proper data structures as soon as it is read.
+        offset = 0
+        while True:
+            chunk, offset = OVOChunk.read_chunk_from(buffer, offset)
+            if chunk is None:
+                break
             self._parse_chunk(chunk)
 
-        return True
+    # --------------------------------------------------------
+    # Count Node Chunks
+    # --------------------------------------------------------
+    def _count_node_chunks(self, buffer) -> int:
+        """
+        Counts the chunks that become NodeRecords (NODE, LIGHT, MESH).
+
+        Only the chunk headers are unpacked; chunk bodies are skipped.
+
+        :param buffer: The whole file contents.
+        :return: The number of node-like chunks in the buffer.
+        """
+        node_parsers = self._node_parsers
+        count = 0
+        offset = 0
+        while True:
+            chunk, offset = OVOChunk.read_chunk_from(buffer, offset)
+            if chunk is None:
+                return count
+            if chunk.chunk_id in node_parsers:
+                count += 1
 
     # --------------------------------------------------------
     # Parse Chunk
@@ -108,33 +230,36 @@ class OVOImporterParser:
           - ChunkType.LIGHT: Processed via _parse_light().
           - ChunkType.MESH: Processed via _parse_mesh().
 
+        Node chunks are resolved with a single lookup in the _node_parsers table.
         Any unhandled chunk IDs are logged as warnings.
 
         :param chunk: The OVOChunk to parse.
         """
-        if chunk.chunk_id == ChunkType.MATERIAL:
-            mat = self._parse_material(chunk.data)
+        # A truncated file can declare more data than it holds
+        end = min(chunk.offset + chunk.chunk_size, len(chunk.buffer))
+        parse_node = self._node_parsers.get(chunk.chunk_id)
+        if parse_node is not None:
+            self.node_records[self._node_index] = parse_node(chunk.buffer, chunk.offset, end)
+            self._node_index += 1
+        elif chunk.chunk_id == ChunkType.MATERIAL:
+            mat = self._parse_material(chunk.buffer, chunk.offset, end)
             self.materials[mat.name] = mat
-        elif chunk.chunk_id == ChunkType.NODE:
-            node_rec = self._parse_node(chunk.data)
-            self.node_records.append(node_rec)
-        elif chunk.chunk_id == ChunkType.LIGHT:
-            light_rec = self._parse_light(chunk.data)
-            self.node_records.append(light_rec)
-        elif chunk.chunk_id == ChunkType.MESH:
-            mesh_rec = self._parse_mesh(chunk.data)
-            self.node_records.append(mesh_rec)
         else:
             log(f"[OVOImporterParser] WARNING: Unhandled chunk ID={chunk.chunk_id}", category="WARNING")
 
     # ========================================================
     # Parsing Methods for Specific Chunk Types
     # ========================================================
+    # Every method reads from the whole-file buffer starting at an absolute
+    # offset (the start of the chunk data) and advances a local offset as it
+    # unpacks fields, so no stream object is created per chunk. Each read is
+    # checked against the end of the chunk data, so a malformed chunk fails at
+    # its own boundary instead of silently reading the next chunk.
 
     # --------------------------------------------------------
     # Parse Material
     # --------------------------------------------------------
-    def _parse_material(self, data: bytes) -> OVOMaterial:
+    def _parse_material(self, buf, off: int, end: int) -> OVOMaterial:
         """
         Parses a MATERIAL chunk (ChunkType.MATERIAL, typically ID=9).
 
@@ -147,35 +272,43 @@ class OVOImporterParser:
           - Transparency (float)
           - Five texture strings (albedo, normal, height, roughness, metalness)
 
-        :param data: Raw bytes from the chunk.
+        :param buf: The whole file contents.
+        :param off: Offset of the chunk data within buf.
+        :param end: Offset of the end of the chunk data within buf.
         :return: An OVOMaterial instance populated with the parsed values.
         """
-        f = io.BytesIO(data)
-        name = read_null_terminated_string(f)
-        emissive = struct.unpack("<3f", f.read(12))
-        base_color = struct.unpack("<3f", f.read(12))
-        roughness = struct.unpack("<f", f.read(4))[0]
-        metallic = struct.unpack("<f", f.read(4))[0]
-        transparency = struct.unpack("<f", f.read(4))[0]
-
-        # Read the five texture strings.
-        ttypes = ["albedo", "normal", "height", "roughness", "metalness"]
-        textures = {}
-        for t in ttypes:
-            tname = read_null_terminated_string(f)
-            if tname == "[none]":
-                tname = None
-            textures[t] = tname
-
-        log(f"Parsed material: '{name}' | BaseColor={base_color}, Roughness={roughness:.2f}, Metallic={metallic:.2f}",category="MATERIAL", indent=1)
+        name, off = read_cstr(buf, off, end)
+        (ex, ey, ez, br, bg, bb,
+         roughness, metallic, transparency) = _unpack(_MATERIAL_VALUES, buf, off, end)
+        off += _MATERIAL_VALUES.size
+        emissive = (ex, ey, ez)
+        base_color = (br, bg, bb)
+
+        # Read the five texture strings, in file order ("[none]" means no texture).
+        # They stay raw bytes so the placeholder is detected without decoding.
+        albedo, off = read_cstr_bytes(buf, off, end)
+        normal, off = read_cstr_bytes(buf, off, end)
+        height, off = read_cstr_bytes(buf, off, end)
+        roughness_map, off = read_cstr_bytes(buf, off, end)
+        metalness, off = read_cstr_bytes(buf, off, end)
+        textures = {
+            "albedo": _texture_name(albedo),
+            "normal": _texture_name(normal),
+            "height": _texture_name(height),
+            "roughness": _texture_name(roughness_map),
+            "metalness": _texture_name(metalness),
+        }
+
+        if log_enabled("MATERIAL"):
+            log(f"Parsed material: '{name}' | BaseColor={base_color}, Roughness={roughness:.2f}, Metallic={metallic:.2f}",category="MATERIAL", indent=1)
         return OVOMaterial(name, base_color, roughness, metallic, transparency, emissive, textures)
 
     # --------------------------------------------------------
-    # Parse Node
+    # Read Node Header
     # --------------------------------------------------------
-    def _parse_node(self, data: bytes) -> NodeRecord:
+    def _read_node_header(self, buf, off: int, end: int):
         """
-        Parses a generic NODE chunk (ChunkType.NODE, ID=1).
+        Reads the header shared by NODE, LIGHT and MESH chunks.
 
         Expected data:
           - Node name (null-terminated string)
@@ -183,31 +316,56 @@ class OVOImporterParser:
           - children_count (unsigned int)
           - A target string (ignored)
 
-        :param data: Raw bytes of the node chunk.
-        :return: A NodeRecord with node_type set to "NODE".
+        The matrix is copied straight from the buffer into the next slot of
+        self.matrices, so no Python floats or tuples are created for it, and the
+        returned raw_matrix is a (4, 4) view of that slot.
+
+        :param buf: The whole file contents.
+        :param off: Offset of the chunk data within buf.
+        :param end: Offset of the end of the chunk data within buf.
+        :return: A tuple (name, raw_matrix, children_count, offset after the header).
         """
-        f = io.BytesIO(data)
-        node_name = read_null_terminated_string(f)
-        mat_vals = struct.unpack("<16f", f.read(64))
-        raw_matrix = [mat_vals[i:i + 4] for i in range(0, 16, 4)]
-        children_count = struct.unpack("<I", f.read(4))[0]
-        _ = read_null_terminated_string(f)
+        name, off = read_cstr(buf, off, end)
+        _check_size(off, _MATRIX_SIZE, end)
+        raw_matrix = self.matrices[self._node_index]
+        raw_matrix[...] = np.frombuffer(buf, dtype="<f4", count=16, offset=off).reshape(4, 4)
+        off += _MATRIX_SIZE
+        children_count = _unpack(_UINT, buf, off, end)[0]
+        off += _UINT.size
+        # The target name is unused; skip it without decoding
+        _, off = read_cstr_bytes(buf, off, end)
+        return name, raw_matrix, children_count, off
 
-        log(f"Parsed node: '{node_name}' | Children={children_count}", category="NODE", indent=1)
-        return NodeRecord(node_name, "NODE", children_count, raw_matrix)
+    # --------------------------------------------------------
+    # Parse Node
+    # --------------------------------------------------------
+    def _parse_node(self, buf, off: int, end: int) -> NodeRecord:
+        """
+        Parses a generic NODE chunk (ChunkType.NODE, ID=1).
+
+        Expected data:
+          - The node header (see _read_node_header)
+
+        :param buf: The whole file contents.
+        :param off: Offset of the chunk data within buf.
+        :param end: Offset of the end of the chunk data within buf.
+        :return: A NodeRecord with node_type set to ChunkType.NODE.
+        """
+        node_name, raw_matrix, children_count, off = self._read_node_header(buf, off, end)
+
+        if log_enabled("NODE"):
+            log(f"Parsed node: '{node_name}' | Children={children_count}", category="NODE", indent=1)
+        return NodeRecord(node_name, ChunkType.NODE, children_count, raw_matrix)
 
     # --------------------------------------------------------
     # Parse Light
     # --------------------------------------------------------
-    def _parse_light(self, data: bytes) -> NodeRecord:
+    def _parse_light(self, buf, off: int, end: int) -> NodeRecord:
         """
         Parses a LIGHT chunk (ChunkType.LIGHT, ID=16).
 
         Expected data:
-          - Light name (null-terminated string)
-          - 4x4 transformation matrix (16 floats, row-major)
-          - children_count (unsigned int)
-          - A target string (ignored)
+          - The node header (see _read_node_header)
           - Light type (1 byte)
           - Color (3 floats)
           - Radius (float)
@@ -216,33 +374,21 @@ class OVOImporterParser:
           - Spot exponent (float)
           - Shadow flag (1 byte)
           - Volumetric flag (1 byte)
-        :param data: Raw bytes of the light chunk.
-        :return: A NodeRecord with node_type set to "LIGHT", filled with light parameters.
+        :param buf: The whole file contents.
+        :param off: Offset of the chunk data within buf.
+        :param end: Offset of the end of the chunk data within buf.
+        :return: A NodeRecord with node_type set to ChunkType.LIGHT, filled with light parameters.
         """
-        f = io.BytesIO(data)
-        light_name = read_null_terminated_string(f)
-        mat_vals = struct.unpack("<16f", f.read(64))
-        raw_matrix = [mat_vals[i:i + 4] for i in range(0, 16, 4)]
-        children_count = struct.unpack("<I", f.read(4))[0]
-        _ = read_null_terminated_string(f)
-
-        light_type = struct.unpack("<B", f.read(1))[0]
-        color = struct.unpack("<3f", f.read(12))
-        radius = struct.unpack("<f", f.read(4))[0]
+        light_name, raw_matrix, children_count, off = self._read_node_header(buf, off, end)
 
-        # Read the original direction from the file
-        dx, dy, dz = struct.unpack("<3f", f.read(12))
+        (light_type, cr, cg, cb, radius, dx, dy, dz,
+         cutoff, spot_exp, shadow, volumetric) = _unpack(_LIGHT_VALUES, buf, off, end)
+        color = (cr, cg, cb)
 
-        # Store the original direction for debugging
+        # Store the original direction from the file
         original_direction = (dx, dy, dz)
 
-
-        cutoff = struct.unpack("<f", f.read(4))[0]
-        spot_exp = struct.unpack("<f", f.read(4))[0]
-        shadow = struct.unpack("<B", f.read(1))[0]
-        volumetric = struct.unpack("<B", f.read(1))[0]
-
-        rec = NodeRecord(light_name, "LIGHT", children_count, raw_matrix)
+        rec = NodeRecord(light_name, ChunkType.LIGHT, children_count, raw_matrix)
         rec.light_type = light_type
         rec.color = color
         rec.radius = radius
@@ -257,15 +403,12 @@ class OVOImporterParser:
     # --------------------------------------------------------
     # Parse Mesh
     # --------------------------------------------------------
-    def _parse_mesh(self, data: bytes) -> NodeRecord:
+    def _parse_mesh(self, buf, off: int, end: int) -> NodeRecord:
         """
         Parses a MESH chunk (ChunkType.MESH, ID=18).
 
         Expected data:
-          - Mesh name (null-terminated string)
-          - 4x4 transformation matrix (16 floats, row-major)
-          - children_count (unsigned int)
-          - A target string (ignored)
+          - The node header (see _read_node_header)
           - Mesh subtype (1 byte)
           - Material name (null-terminated string)
           - Bounding sphere (float) followed by bounding box (3 floats each for min and max)
@@ -274,31 +417,28 @@ class OVOImporterParser:
           - If LOD count > 0: vertex_count (unsigned int), face_count (unsigned int),
             followed by the vertex data (position, packed normal, packed UV, tangent) and face indices.
 
-        :param data: Raw bytes of the mesh chunk.
-        :return: A NodeRecord with node_type set to "MESH", including geometry and physics if available.
+        :param buf: The whole file contents.
+        :param off: Offset of the chunk data within buf.
+        :param end: Offset of the end of the chunk data within buf.
+        :return: A NodeRecord with node_type set to ChunkType.MESH, including geometry and physics if available.
         """
-        f = io.BytesIO(data)
-        mesh_name = read_null_terminated_string(f)
-        mvals = struct.unpack("<16f", f.read(64))
-        raw_matrix = [mvals[i:i + 4] for i in range(0, 16, 4)]
-        children_count = struct.unpack("<I", f.read(4))[0]
-        _ = read_null_terminated_string(f)
-        mesh_subtype = struct.unpack("<B", f.read(1))[0]
-        material_name = read_null_terminated_string(f)
-
-        # Read bounding data
-        bounding_radius = struct.unpack("<f", f.read(4))[0]
-        min_box = f.read(12)  # min box
-        max_box = f.read(12)  # max box
-
-        physics_flag = struct.unpack("<B", f.read(1))[0]
+        mesh_name, raw_matrix, children_count, off = self._read_node_header(buf, off, end)
+        _check_size(off, 1, end)
+        off += 1  # mesh subtype (unused)
+        material_name, off = read_cstr(buf, off, end)
+
+        # Read bounding data (min/max box kept as raw bytes) and the physics flag
+        bounding_radius, min_box, max_box, physics_flag = _unpack(_MESH_BOUNDS, buf, off, end)
+        off += _MESH_BOUNDS.size
+
         physics_data = None
         if physics_flag:
-            physics_data = self._read_physics_data(f)
+            physics_data, off = self._read_physics_data(buf, off, end)
 
-        lod_count = struct.unpack("<I", f.read(4))[0]
+        lod_count = _unpack(_UINT, buf, off, end)[0]
+        off += _UINT.size
 
-        rec = NodeRecord(mesh_name, "MESH", children_count, raw_matrix)
+        rec = NodeRecord(mesh_name, ChunkType.MESH, children_count, raw_matrix)
         rec.material_name = material_name
         rec.physics_data = physics_data
         rec.lod_count = lod_count
@@ -309,40 +449,36 @@ class OVOImporterParser:
         rec.max_box = max_box
 
         if lod_count == 0:
-            log(f"Mesh '{mesh_name}' has no LODs — skipping geometry", category="MESH", indent=1)
+            if log_enabled("MESH"):
+                log(f"Mesh '{mesh_name}' has no LODs — skipping geometry", category="MESH", indent=1)
             return rec
 
         # Read geometry: number of vertices and faces.
-        vertex_count, face_count = struct.unpack("<2I", f.read(8))
-        vertices = []
-        faces = []
-        uvs = []
-
-        for _ in range(vertex_count):
-            px, py, pz = struct.unpack("<3f", f.read(12))
-            # Skip the packed normal.
-            _ = struct.unpack("<I", f.read(4))[0]
-            uv_data = struct.unpack("<I", f.read(4))[0]
-            f.read(4)  # Skip tangent data.
-            vertices.append((px, py, pz))
-            uv = decode_half2x16(uv_data)
-            uvs.append(uv)
-
-        for _ in range(face_count):
-            idxs = struct.unpack("<3I", f.read(12))
-            faces.append(idxs)
-
-        rec.vertices = vertices
-        rec.faces = faces
-        rec.uvs = uvs
-
-        log(f"Parsed mesh: '{mesh_name}' | Vertices: {vertex_count}, Faces: {face_count}", category="MESH", indent=1)
+        vertex_count, face_count = _unpack(_UINT2, buf, off, end)
+        off += _UINT2.size
+        # Both streams must fit in the chunk before any view is taken of them
+        _check_size(off, vertex_count * _VERTEX_DTYPE.itemsize + face_count * 12, end)
+
+        # Decode the whole vertex and face streams at once as numpy arrays
+        vdata = np.frombuffer(buf, dtype=_VERTEX_DTYPE, count=vertex_count, offset=off)
+        off += vertex_count * _VERTEX_DTYPE.itemsize
+        faces = np.frombuffer(buf, dtype="<u4", count=face_count * 3, offset=off)
+
+        # Every array below is a copy, so no record keeps the file buffer alive
+        # (an explicit copy: a single-vertex view is already contiguous)
+        rec.vertices = vdata["pos"].copy()
+        rec.faces = faces.astype(np.int32).reshape(-1, 3)
+        # UVs as a contiguous (N, 2) float32 array, ready for vectorized gathers
+        rec.uvs = vdata["uv"].astype(np.float32)
+
+        if log_enabled("MESH"):
+            log(f"Parsed mesh: '{mesh_name}' | Vertices: {vertex_count}, Faces: {face_count}", category="MESH", indent=1)
         return rec
 
     # --------------------------------------------------------
     # Read Physics Data for Mesh Chunks
     # --------------------------------------------------------
-    def _read_physics_data(self, f) -> OVOPhysicsData:
+    def _read_physics_data(self, buf, off: int, end: int):
         """
         Reads the physics section from a mesh chunk.
 
@@ -359,28 +495,21 @@ class OVOImporterParser:
           - For each hull: number of vertices, number of faces, hull centroid,
             then the vertices (each 3 floats) and faces (each 3 unsigned ints) – which are skipped.
 
-        :param f: A file-like object (BytesIO) positioned at the start of physics data.
-        :return: An OVOPhysicsData instance with the parsed physics parameters.
+        :param buf: The whole file contents.
+        :param off: Offset of the physics data within buf.
+        :param end: Offset of the end of the chunk data within buf.
+        :return: A tuple (OVOPhysicsData, offset after the physics data).
         """
-        obj_type = struct.unpack("<B", f.read(1))[0]
-        _ = f.read(1)  # contCollision
-        _ = f.read(1)  # collide_with_rb
-        hull_type = struct.unpack("<B", f.read(1))[0]
-        _ = f.read(12)  # mass center
-
-        mass, static_fric, dyn_fric, bounciness, lin_damp, ang_damp = struct.unpack("<6f", f.read(24))
-        nr_hulls = struct.unpack("<I", f.read(4))[0]
-        _ = f.read(4)  # padding
-        _ = f.read(16)  # two reserved pointers
-
-        # Skip geometry for each hull.
+        (obj_type, _cont_collision, _collide_with_rb, hull_type,
+         mass, static_fric, dyn_fric, bounciness, lin_damp, ang_damp,
+         nr_hulls) = _unpack(_PHYSICS_VALUES, buf, off, end)
+        off += _PHYSICS_VALUES.size
+
+        # Skip geometry for each hull: vertices (3 floats) and faces (3 uints) are 12 bytes each.
         for _ in range(nr_hulls):
-            n_verts = struct.unpack("<I", f.read(4))[0]
-            n_faces = struct.unpack("<I", f.read(4))[0]
-            f.read(12)  # hull centroid
-            for _ in range(n_verts):
-                f.read(12)
-            for _ in range(n_faces):
-                f.read(12)
-
-        return OVOPhysicsData(obj_type, hull_type, mass, static_fric, dyn_fric, bounciness, lin_damp, ang_damp)
+            n_verts, n_faces = _unpack(_HULL_HEADER, buf, off, end)
+            off += _HULL_HEADER.size + 12 * (n_verts + n_faces)
+            _check_size(off, 0, end)
+
+        physics = OVOPhysicsData(obj_type, hull_type, mass, static_fric, dyn_fric, bounciness, lin_damp, ang_damp)
+        return physics, off
@@ -12,6 +12,18 @@ import math
 import mathutils
 import bpy
 
+# --------------------------------------------------------
+# CONSTANTS
+# --------------------------------------------------------
+# Blender (Z-up) to OpenGL (Y-up) change of basis for direction vectors,
+# built once at import time; its transpose converts back to Blender
+_C = mathutils.Matrix((
+    (1, 0, 0),
+    (0, 0, 1),
+    (0, -1, 0)
+))
+_C_INV = _C.transposed()
+
 # --------------------------------------------------------
 # Light Factory
 # --------------------------------------------------------
@@ -21,7 +33,7 @@ class LightFactory:
 
     It maps the numeric light type from the input data to the appropriate Blender
     light type, sets the light properties such as color and energy, and returns a
-    configured light object.
+    configured light object. The object is left unlinked; the scene builder links it.
     """
 
     @staticmethod
@@ -45,14 +57,9 @@ class LightFactory:
             ldata.spot_size = math.radians(rec.radius)
             ldata.spot_blend = rec.spot_exponent / 10.0
 
-        light_obj = bpy.data.objects.new(rec.name, ldata)
-        if not light_obj.users_collection:
-            bpy.context.collection.objects.link(light_obj)
-
-        if rec.light_type in [1, 2] and rec.direction:
-            # Transform direction from OpenGL coordinates to Blender coordinates
-            transformed_direction = LightFactory.transform_direction(rec.direction)
-        return light_obj
+        # The orientation comes from the node matrix applied by the scene builder,
+        # so the stored direction is not converted here.
+        return bpy.data.objects.new(rec.name, ldata)
 
     @staticmethod
     def transform_direction(direction):
@@ -68,15 +75,5 @@ class LightFactory:
         if not direction:
             return mathutils.Vector((0, 0, -1))
 
-        # Conversion matrix (3x3 per direction vectors)
-        C = mathutils.Matrix((
-            (1, 0, 0),
-            (0, 0, 1),
-            (0, -1, 0)
-        ))
-        C_inv = C.transposed()  # Inverse to convert from OpenGL to Blender
-
-        dir_vec = mathutils.Vector(direction)
-        transformed = C_inv @ dir_vec
-
-        return transformed.normalized()
\ No newline at end of file
+        # The product returns a new vector, so the constant matrix is never modified
+        return (_C_INV @ mathutils.Vector(direction)).normalized()
\ No newline at end of file
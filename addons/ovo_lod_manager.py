@@ -11,6 +11,7 @@
 # --------------------------------------------------------
 import bpy
 import bmesh
+import numpy as np
 from mathutils import Vector
 
 try:
@@ -38,34 +39,96 @@ class OVOLodManager:
         self.LOD_FACE_THRESHOLD = 300000  # Threshold for multi-LOD generation
         self.LOD_RATIOS = [1.0, 0.8, 0.5, 0.3, 0.1]  # Ratios for LOD levels
 
+        # Depsgraph fetched once per manager, and the triangle count of each
+        # object keyed by its pointer, so repeated threshold checks (the
+        # exporter's and generate_lod_meshes') evaluate the object only once.
+        # No evaluated mesh is kept between calls.
+        self._depsgraph = None
+        self._face_counts = {}
+
     # --------------------------------------------------------
-    # Should Generate Multi-LOD
+    # Count Triangles
     # --------------------------------------------------------
-    def should_generate_multi_lod(self, obj):
+    def _count_triangles(self, obj):
         """
-        Determines if multiple LODs should be generated for the object.
+        Counts the triangles of the evaluated object, once per object.
+
+        The count comes from Blender's own triangulation of the mesh
+        (calc_loop_triangles), which matches the faces left by
+        bmesh.ops.triangulate without building a BMesh. The evaluated
+        mesh is released before returning.
 
         Args:
-            obj: Blender object to analyze
+            obj: Blender object to evaluate
 
         Returns:
-            bool: True if multi-LOD should be generated, False otherwise
+            int: Number of triangles of the full-detail mesh
+        """
+        key = obj.as_pointer()
+        face_count = self._face_counts.get(key)
+        if face_count is None:
+            if self._depsgraph is None:
+                self._depsgraph = bpy.context.evaluated_depsgraph_get()
+            obj_eval = obj.evaluated_get(self._depsgraph)
+            mesh = obj_eval.to_mesh()
+            mesh.calc_loop_triangles()
+            face_count = len(mesh.loop_triangles)
+            obj_eval.to_mesh_clear()
+            self._face_counts[key] = face_count
+        return face_count
+
+    @staticmethod
+    def _is_triangulated(mesh):
         """
-        # Get the mesh data
-        depsgraph = bpy.context.evaluated_depsgraph_get()
-        obj_eval = obj.evaluated_get(depsgraph)
+        Checks whether every polygon of a mesh is already a triangle.
+
+        Args:
+            mesh: Blender mesh to check
+
+        Returns:
+            bool: True if the triangulate pass can be skipped
+        """
+        loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get("loop_total", loop_totals)
+        return bool((loop_totals == 3).all())
+
+    def _build_top_lod(self, obj):
+        """
+        Builds the triangulated full-detail BMesh of the evaluated object.
+
+        Args:
+            obj: Blender object to process
+
+        Returns:
+            BMesh: Triangulated full-detail mesh, freed with the other LODs
+        """
+        if self._depsgraph is None:
+            self._depsgraph = bpy.context.evaluated_depsgraph_get()
+        obj_eval = obj.evaluated_get(self._depsgraph)
         mesh = obj_eval.to_mesh()
 
-        # Create BMesh for triangulation
+        # The BMesh owns a copy of the data, so the evaluated mesh is released right away
         bm = bmesh.new()
         bm.from_mesh(mesh)
-        bmesh.ops.triangulate(bm, faces=bm.faces)
+        if not self._is_triangulated(mesh):
+            bmesh.ops.triangulate(bm, faces=bm.faces)
+        obj_eval.to_mesh_clear()
+        return bm
+
+    # --------------------------------------------------------
+    # Should Generate Multi-LOD
+    # --------------------------------------------------------
+    def should_generate_multi_lod(self, obj):
+        """
+        Determines if multiple LODs should be generated for the object.
 
-        face_count = len(bm.faces)
+        Args:
+            obj: Blender object to analyze
 
-        # Clean up
-        bm.free()
-        obj_eval.to_mesh_clear()
+        Returns:
+            bool: True if multi-LOD should be generated, False otherwise
+        """
+        face_count = self._count_triangles(obj)
 
         log(f"Face count: {face_count}", category="MESH", indent=2)
         return face_count > self.LOD_FACE_THRESHOLD
@@ -99,16 +162,8 @@ class OVOLodManager:
         Returns:
             list: List containing a single BMesh object
         """
-        depsgraph = bpy.context.evaluated_depsgraph_get()
-        obj_eval = obj.evaluated_get(depsgraph)
-        mesh = obj_eval.to_mesh()
-
-        bm = bmesh.new()
-        bm.from_mesh(mesh)
-        bmesh.ops.triangulate(bm, faces=bm.faces)
-
         # Return a list with a single LOD
-        return [bm]
+        return [self._build_top_lod(obj)]
 
     def _generate_multiple_lods(self, obj):
         """
@@ -126,72 +181,59 @@ class OVOLodManager:
         temp_collection = bpy.data.collections.new("_temp_lod_collection")
         bpy.context.scene.collection.children.link(temp_collection)
 
+        # A single working copy is decimated progressively: each LOD is taken
+        # from the previous one, so its ratio is relative to the previous ratio
+        lod_obj = None
+        prev_ratio = 1.0
+
         try:
-            # Make a copy of the original object for each LOD level
-            for i, ratio in enumerate(self.LOD_RATIOS):
+            for ratio in self.LOD_RATIOS:
                 # For the highest detail LOD (ratio=1.0), just use the original mesh
                 if ratio == 1.0:
-                    depsgraph = bpy.context.evaluated_depsgraph_get()
-                    obj_eval = obj.evaluated_get(depsgraph)
-                    mesh = obj_eval.to_mesh()
-
-                    bm = bmesh.new()
-                    bm.from_mesh(mesh)
-                    bmesh.ops.triangulate(bm, faces=bm.faces)
-
-                    # Make sure we copy over UV layers from the original mesh
-                    if len(mesh.uv_layers) > 0:
-                        uv_name = mesh.uv_layers.active.name
-                        uv_layer = bm.loops.layers.uv.new(uv_name)
+                    # UV layers come along with from_mesh in the BMesh
+                    bm = self._build_top_lod(obj)
 
                     log(f"LOD ratio {ratio:.2f}: {len(bm.faces)} faces (original)", category="MESH", indent=2)
                     lod_meshes.append(bm)
                     continue
 
-                # Create a copy of the object
-                lod_obj = obj.copy()
-                lod_obj.data = obj.data.copy()
-                lod_obj.name = f"{obj.name}_LOD_{i}"
-                temp_collection.objects.link(lod_obj)
+                # Create the working copy of the object on the first decimated LOD
+                if lod_obj is None:
+                    lod_obj = obj.copy()
+                    lod_obj.data = obj.data.copy()
+                    lod_obj.name = f"{obj.name}_LOD"
+                    temp_collection.objects.link(lod_obj)
+                    bpy.context.view_layer.objects.active = lod_obj
 
                 # Add a Decimate modifier
                 decimate_mod = lod_obj.modifiers.new(name="Decimate", type='DECIMATE')
-                decimate_mod.ratio = ratio
+                decimate_mod.ratio = ratio / prev_ratio
                 decimate_mod.use_collapse_triangulate = True
+                prev_ratio = ratio
 
                 # Apply the modifier
-                bpy.context.view_layer.objects.active = lod_obj
                 bpy.ops.object.modifier_apply(modifier="Decimate")
 
-                # Create a BMesh from the decimated object
+                # Create a BMesh from the decimated object; from_mesh carries
+                # the UV layers (and the active one) over in C. Collapse with
+                # use_collapse_triangulate already leaves only triangles, so
+                # the triangulate pass normally has nothing to do
                 bm = bmesh.new()
                 bm.from_mesh(lod_obj.data)
-                bmesh.ops.triangulate(bm, faces=bm.faces)
-
-                # Make sure we copy over UV layers
-                if len(lod_obj.data.uv_layers) > 0:
-                    uv_name = lod_obj.data.uv_layers.active.name
-                    uv_layer = bm.loops.layers.uv.new(uv_name)
-
-                    # Copy UV data from the mesh to the bmesh
-                    for face in bm.faces:
-                        for loop in face.loops:
-                            mesh_loop_index = loop.index
-                            if mesh_loop_index < len(lod_obj.data.loops):
-                                mesh_loop = lod_obj.data.loops[mesh_loop_index]
-                                if mesh_loop.vertex_index < len(lod_obj.data.uv_layers.active.data):
-                                    uv_data = lod_obj.data.uv_layers.active.data[mesh_loop.index]
-                                    loop[uv_layer].uv = uv_data.uv
+                if not self._is_triangulated(lod_obj.data):
+                    bmesh.ops.triangulate(bm, faces=bm.faces)
 
                 log(f"LOD ratio {ratio:.2f}: {len(bm.faces)} faces", category="MESH", indent=2)
                 lod_meshes.append(bm)
 
-                # Remove the LOD object
-                bpy.data.objects.remove(lod_obj)
-
         finally:
             # Clean up
             try:
+                # Remove the working copy along with its mesh data
+                if lod_obj is not None:
+                    lod_data = lod_obj.data
+                    bpy.data.objects.remove(lod_obj)
+                    bpy.data.meshes.remove(lod_data)
                 # Remove the temporary collection
                 bpy.data.collections.remove(temp_collection)
             except:
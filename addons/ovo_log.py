@@ -3,7 +3,8 @@
 # ================================================================
 # Centralized logging for OVO Tools (import/export).
 # Provides a single `log()` function for unified formatting,
-# indentation, and ANSI coloring across modules.
+# indentation, and ANSI coloring across modules, and `log_enabled()`
+# so hot paths can skip building messages for muted categories.
 # ================================================================
 
 # --------------------------------------------------------
@@ -14,6 +15,49 @@ try:
 except ImportError:
     from ovo_types import GREEN, YELLOW, BLUE, RED, MAGENTA, RESET, BOLD
 
+# --------------------------------------------------------
+# Constants
+# --------------------------------------------------------
+# Map categories to ANSI color codes from ovo_types
+_COLOR_MAP = {
+    "MESH": GREEN,
+    "LIGHT": YELLOW,
+    "NODE": BLUE,
+    "MATERIAL": MAGENTA,
+    "WARNING": RED,
+    "ERROR": RED
+}
+# Colored "[CATEGORY]" prefix of each known category, built once
+_TAGS = {cat: f"{BOLD}{color}[{cat}]{RESET}" for cat, color in _COLOR_MAP.items()}
+# Indentation strings for the usual indent levels
+_INDENT = tuple("  " * i for i in range(8))
+
+# --------------------------------------------------------
+# Muted Categories
+# --------------------------------------------------------
+# Upper-case categories whose messages are dropped. Empty by default, so
+# every category is printed; add e.g. "MESH" to silence per-mesh output.
+MUTED_CATEGORIES = set()
+
+
+def log_enabled(category: str = "") -> bool:
+    """
+    Check whether messages of a category are printed.
+
+    Callers on hot paths test this before formatting an f-string, so no
+    message is built for a muted category.
+
+    Args:
+        category (str): Entity category, as passed to log().
+
+    Returns:
+        bool: False if the category is in MUTED_CATEGORIES.
+    """
+    # Known categories are already upper-case, which skips the upper() call
+    if category not in _COLOR_MAP:
+        category = category.upper()
+    return category not in MUTED_CATEGORIES
+
 # --------------------------------------------------------
 # Logging Function
 # --------------------------------------------------------
@@ -33,23 +77,24 @@ def log(message: str, category: str = "", indent: int = 0):
         indent (int): Number of indentation levels to apply.
     """
 
+    # Known categories are already upper-case, which skips the upper() call
+    if category not in _COLOR_MAP:
+        category = category.upper()
+
+    # Drop messages of muted categories
+    if category in MUTED_CATEGORIES:
+        return
+
+    indent_str = _INDENT[indent] if 0 <= indent < len(_INDENT) else "  " * indent
+
     # If no category is provided, print plain text
     if not category:
-        print("  " * indent + message)
+        print(indent_str + message)
         return
 
-    # Map categories to ANSI color codes from ovo_types
-    color_map = {
-        "MESH": GREEN,
-        "LIGHT": YELLOW,
-        "NODE": BLUE,
-        "MATERIAL": MAGENTA,
-        "WARNING": RED,
-        "ERROR": RED
-    }
-    # Determine the color for the given category; default to node color
-    color = color_map.get(category.upper(), BLUE)
-
-    indent_str = "  " * indent
-
-    print(f"{BOLD}{color}[{category.upper()}]{RESET} {indent_str}{message}")
\ No newline at end of file
+    # Determine the prefix for the given category; default to node color
+    tag = _TAGS.get(category)
+    if tag is None:
+        tag = f"{BOLD}{BLUE}[{category}]{RESET}"
+
+    print(f"{tag} {indent_str}{message}")
\ No newline at end of file
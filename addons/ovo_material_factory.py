@@ -34,6 +34,10 @@ class MaterialFactory:
     # We need to keep these files as long as Blender is using them
     flipped_textures = set()
 
+    # Class-level cache of loaded images keyed by (source path, flip flag), so a
+    # texture shared by several materials is flipped and loaded only once
+    _image_cache = {}
+
     @staticmethod
     def create(ovo_material, texture_directory, flip_textures=True):
         mat = bpy.data.materials.new(name=ovo_material.name)
@@ -41,27 +45,24 @@ class MaterialFactory:
         nodes = mat.node_tree.nodes
         links = mat.node_tree.links
 
-        # Locate the Principled BSDF node.
-        bsdf = None
-        for node in nodes:
-            if node.type == 'BSDF_PRINCIPLED':
-                bsdf = node
-                break
+        # Locate the Principled BSDF node; a new node tree names it "Principled BSDF".
+        bsdf = nodes.get("Principled BSDF")
         if bsdf is None:
             bsdf = nodes.new('ShaderNodeBsdfPrincipled')
+        inputs = bsdf.inputs
 
         # Set basic material properties.
-        bsdf.inputs["Base Color"].default_value = (*ovo_material.base_color, 1.0)
-        bsdf.inputs["Roughness"].default_value = ovo_material.roughness
-        bsdf.inputs["Metallic"].default_value = ovo_material.metallic
+        inputs["Base Color"].default_value = (*ovo_material.base_color, 1.0)
+        inputs["Roughness"].default_value = ovo_material.roughness
+        inputs["Metallic"].default_value = ovo_material.metallic
         if ovo_material.transparency < 1.0:
             mat.blend_method = 'BLEND'
             mat.shadow_method = 'HASHED'
-            bsdf.inputs["Alpha"].default_value = ovo_material.transparency
-        if "Emission" in bsdf.inputs:
-            bsdf.inputs["Emission"].default_value = (*ovo_material.emissive, 1.0)
+            inputs["Alpha"].default_value = ovo_material.transparency
+        if "Emission" in inputs:
+            inputs["Emission"].default_value = (*ovo_material.emissive, 1.0)
 
-        def load_and_link(tex_key, bsdf_input, set_non_color=True, node_label=""):
+        def load_and_link(tex_key, bsdf_input, set_non_color=True, node_label="", converter_node_type=None):
             tex_file = ovo_material.textures.get(tex_key)
             if not tex_file or tex_file == "[none]":
                 log(f"No {tex_key} texture defined for material '{ovo_material.name}'", category="MATERIAL", indent=1)
@@ -72,37 +73,9 @@ class MaterialFactory:
                 log(f"{tex_key.capitalize()} texture '{tex_file}' not found at '{tex_path}'", category="WARNING", indent=1)
                 return
 
-            # Flag to track if we've created a flipped version
-            flipped_version_created = False
-            original_path = tex_path
-
             try:
-                # Check if it's a DDS file that needs flipping
-                if flip_textures and tex_path.lower().endswith('.dds'):
-                    if OVOTextureFlipper.is_dds_file(tex_path):
-                        # Create a flipped file with a distinctive name
-                        texture_name = os.path.basename(tex_path)
-                        texture_base, texture_ext = os.path.splitext(texture_name)
-                        flipped_path = os.path.join(texture_directory, f"{texture_base}_flipped{texture_ext}")
-
-                        log(f"[MaterialFactory] Flipping {tex_key} texture '{tex_file}'", category="MATERIAL", indent=1)
-                        try:
-                            OVOTextureFlipper.flip_dds_texture(tex_path, flipped_path)
-                            tex_path = flipped_path  # Use the flipped texture
-                            flipped_version_created = True
-                            # Add to our tracking set so we know this is a flipped texture
-                            MaterialFactory.flipped_textures.add(flipped_path)
-
-                            log(f"[MaterialFactory] Texture flipped successfully: '{flipped_path}'", category="MATERIAL", indent=2)
-                        except Exception as ex:
-                            log(f"[MaterialFactory] Failed to flip texture: {ex}", category="ERROR", indent=2)
-                            log("[MaterialFactory] Using original texture instead", category="WARNING", indent=2)
-                            tex_path = original_path
-
-                # Try to load the image
-                log(f"[MaterialFactory] Loading texture from: '{tex_path}'", category="MATERIAL", indent=2)
-                img = bpy.data.images.load(tex_path, check_existing=True)
-                log(f"[MaterialFactory] Texture loaded successfully: '{img.name}'", category="MATERIAL", indent=2)
+                # Flip (if needed) and load the image, reusing it across materials
+                img = MaterialFactory._load_image(tex_key, tex_path, texture_directory, flip_textures)
 
                 # Create and configure the texture node
                 tex_node = nodes.new('ShaderNodeTexImage')
@@ -111,91 +84,26 @@ class MaterialFactory:
                 if set_non_color:
                     tex_node.image.colorspace_settings.name = 'Non-Color'
 
-                # Connect the texture to the shader
-                links.new(tex_node.outputs["Color"], bsdf.inputs[bsdf_input])
+                # Connect the texture to the shader, through a converter node if requested
+                if converter_node_type == 'NORMAL_MAP':
+                    converter = nodes.new('ShaderNodeNormalMap')
+                    converter.label = "Normal Map Converter"
+                    links.new(tex_node.outputs["Color"], converter.inputs["Color"])
+                    links.new(converter.outputs["Normal"], inputs[bsdf_input])
+                else:
+                    links.new(tex_node.outputs["Color"], inputs[bsdf_input])
                 log(f"[MaterialFactory] Connected '{tex_node.label}' to '{bsdf_input}'", category="MATERIAL", indent=2)
 
             except Exception as ex:
                 log(f"[MaterialFactory] Error processing {tex_key} texture '{tex_path}': {ex}", category="ERROR", indent=2)
 
-                # If we created a flipped version but failed to use it, we can clean it up
-                if flipped_version_created and not os.path.samefile(tex_path, flipped_path):
-                    try:
-                        os.remove(flipped_path)
-                        MaterialFactory.flipped_textures.discard(flipped_path)
-                        log(f"[MaterialFactory] Removed unused flipped texture: '{flipped_path}'", category="MATERIAL", indent=2)
-                    except:
-                        pass
-
         # --- Load and assign maps ---
 
         # --- Albedo Map ---
         load_and_link("albedo", "Base Color", set_non_color=False, node_label="Albedo Texture")
 
         # --- Normal Map ---
-        normal_file = ovo_material.textures.get("normal")
-        if normal_file and normal_file != "[none]":
-            normal_path = os.path.join(texture_directory, normal_file)
-            if not os.path.isfile(normal_path):
-                log(f"[MaterialFactory] Normal texture '{normal_file}' not found at '{normal_path}'", category="WARNING", indent=1)
-            else:
-                # Flag to track if we've created a flipped version
-                flipped_version_created = False
-                original_path = normal_path
-
-                try:
-                    # Check if it's a DDS file that needs flipping
-                    if flip_textures and normal_path.lower().endswith('.dds'):
-                        if OVOTextureFlipper.is_dds_file(normal_path):
-                            # Create a flipped file with a distinctive name
-                            texture_name = os.path.basename(normal_path)
-                            texture_base, texture_ext = os.path.splitext(texture_name)
-                            flipped_path = os.path.join(texture_directory, f"{texture_base}_flipped{texture_ext}")
-
-                            log(f"[MaterialFactory] Flipping normal map '{normal_file}'", category="MATERIAL", indent=1)
-                            try:
-                                OVOTextureFlipper.flip_dds_texture(normal_path, flipped_path)
-                                normal_path = flipped_path  # Use the flipped texture
-                                flipped_version_created = True
-                                # Add to our tracking set
-                                MaterialFactory.flipped_textures.add(flipped_path)
-                                log(f"[MaterialFactory] Normal map flipped: '{flipped_path}'", category="MATERIAL", indent=2)
-                            except Exception as ex:
-                                log(f"[MaterialFactory] Failed to flip normal map: {ex}", category="ERROR", indent=2)
-                                log("[MaterialFactory] Using original normal map instead", category="WARNING", indent=2)
-                                normal_path = original_path
-
-                    # Try to load the normal map
-
-                    log(f"[MaterialFactory] Loading normal map: '{normal_path}'", category="MATERIAL", indent=2)
-                    normal_img = bpy.data.images.load(normal_path, check_existing=True)
-                    log(f"[MaterialFactory] Normal map loaded: '{normal_img.name}'", category="MATERIAL", indent=2)
-
-                    # Create the texture node for the normal map
-                    normal_tex_node = nodes.new('ShaderNodeTexImage')
-                    normal_tex_node.image = normal_img
-                    normal_tex_node.label = "Normal Map"
-                    normal_tex_node.image.colorspace_settings.name = 'Non-Color'
-
-                    # Add normal map converter node
-                    normal_map_node = nodes.new('ShaderNodeNormalMap')
-                    normal_map_node.label = "Normal Map Converter"
-
-                    # Connect the nodes
-                    links.new(normal_tex_node.outputs["Color"], normal_map_node.inputs["Color"])
-                    links.new(normal_map_node.outputs["Normal"], bsdf.inputs["Normal"])
-                    log("[MaterialFactory] Normal map node setup complete", category="MATERIAL", indent=2)
-
-                except Exception as ex:
-                    log(f"[MaterialFactory] Error processing normal map: {ex}", category="ERROR", indent=2)
-                    # If we created a flipped version but failed to use it, we can clean it up
-                    if flipped_version_created and not os.path.samefile(normal_path, flipped_path):
-                        try:
-                            os.remove(flipped_path)
-                            MaterialFactory.flipped_textures.discard(flipped_path)
-                            log(f"[MaterialFactory] Removed unused flipped texture: '{flipped_path}'", category="MATERIAL", indent=2)
-                        except:
-                            pass
+        load_and_link("normal", "Normal", set_non_color=True, node_label="Normal Map", converter_node_type='NORMAL_MAP')
 
         # --- Roughness Map ---
         load_and_link("roughness", "Roughness")
@@ -206,12 +114,91 @@ class MaterialFactory:
         ovo_material.blender_material = mat
         return mat
 
+    # --------------------------------------------------------
+    # Load Image
+    # --------------------------------------------------------
+    @staticmethod
+    def _load_image(tex_key, tex_path, texture_directory, flip_textures):
+        """
+        Load a texture image, flipping DDS files first when requested.
+
+        Images are cached by source path and flip flag, so every later material
+        using the same texture skips the flip and the bpy.data.images lookup.
+        A cached image that has since been removed from Blender is reloaded.
+
+        Args:
+            tex_key (str): Texture slot name, used for logging (e.g. "albedo").
+            tex_path (str): Full path to the source texture file.
+            texture_directory (str): Directory where flipped copies are written.
+            flip_textures (bool): Whether DDS textures are flipped vertically.
+
+        Returns:
+            bpy.types.Image: The loaded image.
+        """
+        cache_key = (tex_path, flip_textures)
+        img = MaterialFactory._image_cache.get(cache_key)
+        if img is not None:
+            try:
+                if bpy.data.images.get(img.name) == img:
+                    log(f"[MaterialFactory] Reusing loaded texture: '{img.name}'", category="MATERIAL", indent=2)
+                    return img
+            except ReferenceError:
+                pass  # The image was removed from Blender since it was cached
+
+        # Flag to track if we've created a flipped version
+        flipped_version_created = False
+        original_path = tex_path
+
+        # Check if it's a DDS file that needs flipping
+        if flip_textures and tex_path.lower().endswith('.dds'):
+            if OVOTextureFlipper.is_dds_file(tex_path):
+                # Create a flipped file with a distinctive name
+                texture_name = os.path.basename(tex_path)
+                texture_base, texture_ext = os.path.splitext(texture_name)
+                flipped_path = os.path.join(texture_directory, f"{texture_base}_flipped{texture_ext}")
+
+                log(f"[MaterialFactory] Flipping {tex_key} texture '{texture_name}'", category="MATERIAL", indent=1)
+                try:
+                    OVOTextureFlipper.flip_dds_texture(tex_path, flipped_path)
+                    tex_path = flipped_path  # Use the flipped texture
+                    flipped_version_created = True
+                    # Add to our tracking set so we know this is a flipped texture
+                    MaterialFactory.flipped_textures.add(flipped_path)
+
+                    log(f"[MaterialFactory] Texture flipped successfully: '{flipped_path}'", category="MATERIAL", indent=2)
+                except Exception as ex:
+                    log(f"[MaterialFactory] Failed to flip texture: {ex}", category="ERROR", indent=2)
+                    log("[MaterialFactory] Using original texture instead", category="WARNING", indent=2)
+                    tex_path = original_path
+
+        try:
+            # Try to load the image
+            log(f"[MaterialFactory] Loading texture from: '{tex_path}'", category="MATERIAL", indent=2)
+            img = bpy.data.images.load(tex_path, check_existing=True)
+            log(f"[MaterialFactory] Texture loaded successfully: '{img.name}'", category="MATERIAL", indent=2)
+        except Exception:
+            # If we created a flipped version but failed to use it, we can clean it up
+            if flipped_version_created:
+                try:
+                    os.remove(flipped_path)
+                    MaterialFactory.flipped_textures.discard(flipped_path)
+                    log(f"[MaterialFactory] Removed unused flipped texture: '{flipped_path}'", category="MATERIAL", indent=2)
+                except:
+                    pass
+            raise
+
+        MaterialFactory._image_cache[cache_key] = img
+        return img
+
     @staticmethod
     def cleanup_flipped_textures():
         """
         Clean up any flipped textures created during the import process.
         This should be called when the addon is being unregistered or when Blender is closing.
         """
+        # Drop cached image references along with the files they came from
+        MaterialFactory._image_cache.clear()
+
         textures_to_remove = list(MaterialFactory.flipped_textures)
         for tex_path in textures_to_remove:
             try:
@@ -10,16 +10,27 @@
 # IMPORTS
 # --------------------------------------------------------
 import bpy
-import mathutils
+import numpy as np
 
 try:
     from .ovo_material_factory import MaterialFactory
     from .ovo_types import HullType
-    from .ovo_log import log
+    from .ovo_log import log, log_enabled
 except ImportError:
     from ovo_material_factory import MaterialFactory
     from ovo_types import HullType
-    from ovo_log import log
+    from ovo_log import log, log_enabled
+
+# Per-axis signs applied after the (x, z, y) swizzle to go from OpenGL to Blender axes
+_AXIS_SIGNS = np.array((1.0, -1.0, 1.0), dtype=np.float32)
+
+# Collision shape mapping from OVO hull types to Blender shapes (unknown types use 'BOX')
+_HULL_MAP = {
+    HullType.HULL_SPHERE: "SPHERE",
+    HullType.HULL_BOX: "BOX",
+    HullType.HULL_CAPSULE: "CAPSULE",
+    HullType.HULL_CONVEX: "CONVEX_HULL",
+}
 
 # --------------------------------------------------------
 # Mesh Factory
@@ -37,6 +48,9 @@ class MeshFactory:
         """
         Creates a Blender mesh object from a parsed NodeRecord.
 
+        The object is not linked to any collection and physics are not applied;
+        the scene builder links all objects in one pass and then calls apply_physics().
+
         Args:
             rec (NodeRecord): Parsed mesh data.
             materials (dict): Dictionary of OVOMaterial instances by name.
@@ -44,32 +58,24 @@ class MeshFactory:
             flip_textures (bool): Whether to flip DDS textures vertically.
 
         Returns:
-            bpy.types.Object: The newly created Blender mesh object.
+            bpy.types.Object: The newly created (unlinked) Blender mesh object.
         """
         # Create mesh data.
-        if not rec.vertices:
+        if not len(rec.vertices):
             mesh_data = bpy.data.meshes.new(rec.name)
         else:
             mesh_data = bpy.data.meshes.new(rec.name)
 
-            transformed_vertices = []
-            for vertex in rec.vertices:
-                transformed_vertex = MeshFactory.transform_vertex(vertex)
-                transformed_vertices.append(transformed_vertex)
-
-            mesh_data.from_pydata(transformed_vertices, [], rec.faces)
-            mesh_data.update()
+            # Convert vertices from OpenGL to Blender axes before the mesh is built,
+            # so the vertex data is written once and never rewritten afterwards
+            transformed_vertices = MeshFactory.transform_vertices(rec.vertices)
+            MeshFactory.build_geometry(mesh_data, transformed_vertices, rec.faces)
             # Create UV map if available.
-            if rec.uvs and len(rec.uvs) == len(rec.vertices):
+            if len(rec.uvs) and len(rec.uvs) == len(rec.vertices):
                 uv_layer = mesh_data.uv_layers.new(name="UVMap")
-                for poly in mesh_data.polygons:
-                    for loop_idx in range(poly.loop_start, poly.loop_start + poly.loop_total):
-                        vert_idx = mesh_data.loops[loop_idx].vertex_index
-                        uv_layer.data[loop_idx].uv = rec.uvs[vert_idx]
+                MeshFactory.assign_uvs(mesh_data, uv_layer, rec.uvs)
 
         mesh_obj = bpy.data.objects.new(rec.name, mesh_data)
-        if not mesh_obj.users_collection:
-            bpy.context.collection.objects.link(mesh_obj)
 
             # Store bounding box data as custom properties if available
         if hasattr(rec, 'bounding_radius') and hasattr(rec, 'min_box') and hasattr(rec, 'max_box'):
@@ -77,45 +83,155 @@ class MeshFactory:
             mesh_obj["ovo_min_box"] = rec.min_box
             mesh_obj["ovo_max_box"] = rec.max_box
 
-            # Log the bounding box information
-            log(f"Bounding data: Radius={rec.bounding_radius}, Min={rec.min_box}, Max={rec.max_box}", category="MESH",
-                indent=2)
+            # Log the bounding box information; the message is only formatted when MESH logging is on
+            if log_enabled("MESH"):
+                log(f"Bounding data: Radius={rec.bounding_radius}, Min={rec.min_box}, Max={rec.max_box}", category="MESH",
+                    indent=2)
 
         # Assign material if available.
         if rec.material_name and rec.material_name in materials:
             ovo_mat = materials[rec.material_name]
-            mat = MaterialFactory.create(ovo_mat, texture_directory, flip_textures=flip_textures)
+            # Meshes sharing an OVO material share a single Blender material
+            mat = ovo_mat.blender_material
+            if mat is None:
+                mat = MaterialFactory.create(ovo_mat, texture_directory, flip_textures=flip_textures)
             if not mesh_obj.data.materials:
                 mesh_obj.data.materials.append(mat)
             else:
                 mesh_obj.data.materials[0] = mat
 
-        # Apply physics if physics data is available.
-        if hasattr(rec, 'physics_data') and rec.physics_data:
-            MeshFactory.apply_physics(mesh_obj, rec.physics_data)
-
         log(f"Created mesh: '{rec.name}' | Vertices={len(rec.vertices)} Faces={len(rec.faces)} Material={rec.material_name}",category="MESH", indent=1)
         return mesh_obj
 
+    # --------------------------------------------------------
+    # Build Geometry
+    # --------------------------------------------------------
+    @staticmethod
+    def build_geometry(mesh_data, vertices, faces):
+        """
+        Fills an empty mesh with vertices and triangular faces using bulk
+        foreach_set calls instead of from_pydata.
+
+        OVO faces are always triangles, so every polygon has three loops and
+        the loop starts are a simple arithmetic sequence. Triangles rejected by
+        validate_faces() are dropped with a warning. Edges are computed by the
+        final update(), and the mesh is shaded flat as from_pydata does.
+
+        Args:
+            mesh_data (bpy.types.Mesh): Empty mesh datablock.
+            vertices (numpy.ndarray): (N, 3) float32 vertex positions (Blender axes).
+            faces: Sequence of (i0, i1, i2) vertex index triples.
+        """
+        tris = np.asarray(faces, dtype=np.int32).reshape(-1, 3)
+
+        valid = MeshFactory.validate_faces(tris, len(vertices))
+        if not valid.all():
+            log(f"Mesh '{mesh_data.name}': skipping {len(tris) - int(valid.sum())} invalid faces",
+                category="WARNING", indent=2)
+            tris = tris[valid]
+
+        mesh_data.vertices.add(len(vertices))
+        mesh_data.attributes["position"].data.foreach_set("vector", np.ravel(vertices))
+
+        mesh_data.loops.add(tris.size)
+        mesh_data.loops.foreach_set("vertex_index", tris.ravel())
+
+        mesh_data.polygons.add(len(tris))
+        mesh_data.polygons.foreach_set("loop_start", np.arange(0, tris.size, 3, dtype=np.int32))
+
+        mesh_data.update(calc_edges=True)
+        mesh_data.shade_flat()
+
+    # --------------------------------------------------------
+    # Validate Faces
+    # --------------------------------------------------------
+    @staticmethod
+    def validate_faces(tris, n_verts):
+        """
+        Checks every triangle at once for out-of-range and repeated vertex indices.
+
+        Args:
+            tris (numpy.ndarray): (F, 3) int32 triangle vertex indices.
+            n_verts (int): Number of vertices in the mesh.
+
+        Returns:
+            numpy.ndarray: (F,) bool mask, True for valid triangles.
+        """
+        a, b, c = tris[:, 0], tris[:, 1], tris[:, 2]
+        in_range = ((tris >= 0) & (tris < n_verts)).all(axis=1)
+        return in_range & (a != b) & (b != c) & (a != c)
+
+    # --------------------------------------------------------
+    # Assign UVs
+    # --------------------------------------------------------
+    @staticmethod
+    def assign_uvs(mesh_data, uv_layer, uvs):
+        """
+        Writes per-vertex UVs to the per-loop UV layer in a single bulk call.
+
+        The loop vertex indices are read with foreach_get, the UVs are gathered
+        per loop with numpy indexing and written back with foreach_set, so no
+        Python code runs per loop.
+
+        Args:
+            mesh_data (bpy.types.Mesh): Mesh whose loops are already built.
+            uv_layer (bpy.types.MeshUVLoopLayer): Target UV layer.
+            uvs (numpy.ndarray): (N, 2) float32 UVs, one per vertex.
+        """
+        loop_vidx = np.empty(len(mesh_data.loops), dtype=np.int32)
+        mesh_data.loops.foreach_get("vertex_index", loop_vidx)
+
+        uv_layer.data.foreach_set("uv", uvs[loop_vidx].ravel())
+
     # --------------------------------------------------------
     # Apply Physics
     # --------------------------------------------------------
+    @staticmethod
+    def add_rigid_bodies(objects):
+        """
+        Registers objects as rigid bodies without calling the rigid body operator per object.
+
+        Ensures the scene has a rigid body world once, links every object to its
+        collection and then assigns the collection to the world. Assigning it makes
+        Blender validate the collection members and create the rigid body settings
+        of those that have none. The objects must already be linked to the scene.
+
+        Args:
+            objects (list): Mesh objects that carry physics data.
+        """
+        scene = bpy.context.scene
+        if not scene.rigidbody_world:
+            bpy.ops.rigidbody.world_add()
+
+        rbw = scene.rigidbody_world
+        collection = rbw.collection
+        if collection is None:
+            collection = bpy.data.collections.new("RigidBodyWorld")
+
+        link = collection.objects.link
+        for obj in objects:
+            link(obj)
+
+        # (Re)assign after linking: the update creates the missing rigid body settings
+        rbw.collection = collection
+
     @staticmethod
     def apply_physics(obj, phys):
         """
         Applies physics properties from NodeRecord physics data to the Blender object.
+        The object should already be registered through add_rigid_bodies(); if it has
+        no rigid body settings yet, the rigid body operator is used as a fallback, run
+        with a context override so the selection and active object are left untouched.
 
         Args:
             obj (bpy.types.Object): The mesh object.
             phys (OVOPhysicsData): Physics configuration.
         """
-        # Ensure a rigid body world exists.
-        if not bpy.context.scene.rigidbody_world:
-            bpy.ops.rigidbody.world_add()
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
-        bpy.ops.rigidbody.object_add(type='ACTIVE')
         rb = obj.rigid_body
+        if rb is None:
+            with bpy.context.temp_override(object=obj, active_object=obj, selected_objects=[obj]):
+                bpy.ops.rigidbody.object_add(type='ACTIVE')
+            rb = obj.rigid_body
 
         if phys.obj_type == 1:
             rb.type = 'ACTIVE'
@@ -124,51 +240,28 @@ class MeshFactory:
         else:
             rb.type = 'ACTIVE'
 
-        # Collision shape mapping
-        HULL_MAP = {
-            HullType.HULL_SPHERE: "SPHERE",
-            HullType.HULL_BOX: "BOX",
-            HullType.HULL_CAPSULE: "CAPSULE",
-            HullType.HULL_CONVEX: "CONVEX_HULL",
-        }
-
-        def get_blender_collision_shape(hull_type: int) -> str:
-            # Default to 'BOX' if hull_type is not recognized
-            return HULL_MAP.get(hull_type, "BOX")
-
         # Apply physics properties
-        rb.collision_shape = get_blender_collision_shape(phys.hull_type)
+        rb.collision_shape = _HULL_MAP.get(phys.hull_type, "BOX")
         rb.friction = phys.dyn_fric
         rb.restitution = phys.bounciness
         rb.linear_damping = phys.lin_damp
         rb.angular_damping = phys.ang_damp
-        obj.select_set(False)
 
         log(f"Applied physics to '{obj.name}' | Type={rb.type} Shape={rb.collision_shape}", category="MESH", indent=2)
 
     @staticmethod
-    def transform_vertex(vertex):
+    def transform_vertices(vertices):
         """
-        Transform a vertex from OpenGL system to Blender system.
+        Transform vertices from OpenGL system to Blender system.
+
+        The conversion (x, y, z) -> (x, -z, y) is applied to all vertices at once
+        on a numpy buffer.
 
         Args:
-            vertex (tuple): Original vertex coordinates (x, y, z)
+            vertices (numpy.ndarray): Original (N, 3) vertex coordinates
 
         Returns:
-            tuple: Transformed vertex coordinates
+            numpy.ndarray: (N, 3) float32 array of transformed vertex coordinates
         """
-        # Conversion matrix
-        C = mathutils.Matrix((
-            (1, 0, 0, 0),
-            (0, 0, 1, 0),
-            (0, -1, 0, 0),
-            (0, 0, 0, 1)
-        ))
-        C_inv = C.transposed()
-
-        # Convert the vertex in homogeneous coordinates
-        v = mathutils.Vector((vertex[0], vertex[1], vertex[2], 1.0))
-        transformed = C_inv @ v
-
-        # Return the tuple without the homogeneous component
-        return (transformed[0], transformed[1], transformed[2])
\ No newline at end of file
+        co = np.asarray(vertices, dtype=np.float32).reshape(-1, 3)
+        return co[:, (0, 2, 1)] * _AXIS_SIGNS
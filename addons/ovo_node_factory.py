@@ -34,14 +34,11 @@ class NodeFactory:
             rec (NodeRecord): Parsed node information from the OVO file.
 
         Returns:
-            bpy.types.Object: Blender object representing the empty node.
+            bpy.types.Object: Blender object representing the empty node (not yet linked).
         """
         node_obj = bpy.data.objects.new(rec.name, None)
         node_obj.empty_display_type = 'PLAIN_AXES'
         node_obj.empty_display_size = 1.0
 
-        if not node_obj.users_collection:
-            bpy.context.collection.objects.link(node_obj)
-
         log(f"Created empty node: '{rec.name}'", category="NODE", indent=1)
         return node_obj
\ No newline at end of file